@@ -0,0 +1,167 @@
+# bet365_parse.py
+# Shared Bet365 scorers parser (Rugby Tryscorers + AFL Goalscorers), no Streamlit here.
+# Output columns: SelectionName | SelectionOdds | FirstOdds | LastOdds | AnyOdds
+# Used by app.py and the Rugby-only "Rugby Try Scorers" page.
+
+from __future__ import annotations
+
+import functools
+import io
+import string
+from array import array
+from itertools import islice
+import numpy as np
+import pandas as pd
+
+# ---------- Parser helpers ----------
+_SPORT_HEADERS = {
+    "rugby": ["Tryscorers"],
+    "afl":   ["Goalscorers", "Goal Scorers"],
+}
+_SCORER_HEADERS = ["Tryscorers", "Goalscorers", "Goal Scorers"]  # permissive (sport=None)
+# Same class as the old ^[A-Za-zÀ-ÖØ-öø-ÿ'’.\- ]{2,}$ regex, checked as a set
+_NAME_CHARS = frozenset(
+    string.ascii_letters
+    + "".join(map(chr, range(0xC0, 0xD7)))    # À-Ö
+    + "".join(map(chr, range(0xD8, 0xF7)))    # Ø-ö
+    + "".join(map(chr, range(0xF8, 0x100)))   # ø-ÿ
+    + "'’.- "
+)
+_SKIP_EXACT = frozenset({
+    "BB", "ET Extra Chance", "Show less", "View by", "Market", "Player",
+    "New", "Bet", "Builder"
+})
+_NO_SCORER = frozenset({"No Tryscorer", "No Goalscorer"})
+
+def _norm(text: str) -> list[str]:
+    # splitlines handles \r\n / \r / \n; dropping empties covers blank runs
+    return [s for s in (ln.strip() for ln in text.splitlines()) if s]
+
+def _locate_headers(lines, groups):
+    """
+    One pass over `lines` -> first index of each header group (-1 if absent).
+    Within a group, earlier aliases win (Tryscorers before Goalscorers).
+    """
+    rank = {a.lower(): (g, r) for g, aliases in enumerate(groups) for r, a in enumerate(aliases)}
+    best = [len(aliases) for aliases in groups]   # best alias rank seen per group
+    found = [-1] * len(groups)
+    settled = 0
+    for i, ln in enumerate(lines):
+        hit = rank.get(ln.lower())
+        if hit is None:
+            continue
+        g, r = hit
+        if r < best[g]:
+            best[g], found[g] = r, i
+            if r == 0:
+                settled += 1
+                if settled == len(groups):
+                    break   # every group has its preferred header; skip the tail
+    return found
+
+def _collect_columns(lines, scorers_i, first_i, last_i, any_i):
+    """
+    One forward pass from the scorers header to the end of `lines`:
+    names until First, then the First / Last / Anytime odds blocks.
+    Returns (names, first, last, anyt), odds as array('d'); all empty if
+    headers are out of order.
+    """
+    names = []
+    first, last, anyt = array("d"), array("d"), array("d")   # unboxed float64
+    if not scorers_i < first_i < last_i < any_i:
+        return names, first, last, anyt
+
+    blocks = iter([(first_i, first), (last_i, last), (any_i, anyt)])
+    next_i, next_bucket = next(blocks)
+    bucket, add_odds = names, None
+    # hot loop: bind lookups to locals once
+    add_name, name_chars = names.append, _NAME_CHARS.issuperset
+    skip, no_scorer = _SKIP_EXACT, _NO_SCORER
+    for i in range(scorers_i + 1, len(lines)):
+        if i == next_i:   # header line: switch to the next block
+            bucket, add_odds = next_bucket, next_bucket.append
+            next_i, next_bucket = next(blocks, (-1, None))
+            continue
+        ln = lines[i]
+        if bucket is names:
+            # skip numbers (jerseys/counts); nothing digit-led can be a name
+            if ln[0].isdigit():
+                continue
+            if ln in skip:
+                continue
+            if ln in no_scorer:
+                add_name(ln); continue
+            if len(ln) >= 2 and name_chars(ln):
+                add_name(ln)
+        else:
+            # digits with at most one inner dot, i.e. what \d+(\.\d+)? accepted;
+            # float() alone would also take "1e5", "1_0" and "1."
+            if ln[0].isdigit() and ln[-1].isdigit() and ln.replace(".", "", 1).isdecimal():
+                add_odds(float(ln))
+    return names, first, last, anyt
+
+@functools.lru_cache(maxsize=32)
+def parse(raw: str, sport: str | None = None) -> pd.DataFrame:
+    """
+    Works for Rugby 'Tryscorers' and AFL 'Goalscorers'.
+    Expects headers: <Tryscorers|Goalscorers> + First + Last + Anytime
+    sport: "rugby" / "afl" to accept only that market's header; None accepts either.
+    Returns the 5 output columns, already in display order. Results are cached
+    per (raw, sport) and shared between callers, so treat the frame as read-only.
+    """
+    if sport is None:
+        scorer_headers = _SCORER_HEADERS
+    elif sport in _SPORT_HEADERS:
+        scorer_headers = _SPORT_HEADERS[sport]
+    else:
+        raise ValueError(f"Unknown sport {sport!r}; expected one of {sorted(_SPORT_HEADERS)}")
+
+    lines = _norm(raw)
+
+    groups = [scorer_headers, ["First"], ["Last"], ["Anytime"]]
+    scorers_i, first_i, last_i, any_i = _locate_headers(lines, groups)
+
+    if min(scorers_i, first_i, last_i, any_i) == -1:
+        raise ValueError(
+            f"Could not find required headers: ({'|'.join(scorer_headers)}) / First / Last / Anytime"
+        )
+
+    names, first, _last, anyt = _collect_columns(lines, scorers_i, first_i, last_i, any_i)
+    # _last is only an alignment check; not displayed
+
+    m = min(len(names), len(first), len(_last), len(anyt))
+    if m == 0:
+        raise ValueError(
+            "No rows parsed. Make sure you copied the whole market incl. First/Last/Anytime."
+        )
+
+    # Final column order in one build; explicit dtypes skip inference.
+    # LastOdds mirrors FirstOdds (shared array, never mutated); SelectionOdds is blank.
+    # Truncate to m without list[:m] copies: odds are array('d') buffers, so
+    # numpy views them directly; names go through islice into a preallocated array.
+    first_arr = np.frombuffer(first, dtype=np.float64, count=m)
+    df = pd.DataFrame({
+        "SelectionName": np.fromiter(islice(names, m), dtype=object, count=m),
+        "SelectionOdds": np.full(m, "", dtype=object),
+        "FirstOdds": first_arr,
+        "LastOdds":  first_arr,
+        "AnyOdds":   np.frombuffer(anyt, dtype=np.float64, count=m),
+    }, copy=False)
+    return df
+
+# ---------- Output helpers ----------
+def fmt_series(s: pd.Series) -> pd.Series:
+    """Odds as copy-box text: 5.0 -> '5', 2.50 -> '2.5' (vectorised, no per-row calls)."""
+    return s.astype(str).str.rstrip("0").str.rstrip(".")
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    # write UTF-8 straight into a bytes buffer (no intermediate str + encode)
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+def to_xlsx_bytes(df: pd.DataFrame, sheet_name: str = "Scorers") -> bytes:
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name=sheet_name)
+    return buf.getvalue()